@@ -1,9 +1,26 @@
 import os
-import json
+import glob
+import hashlib
+import threading
+import time
+import bcrypt
+import click
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
-from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Flask, Response, render_template, request, session, redirect, url_for, flash
+from werkzeug.security import check_password_hash
+
+try:
+    import fcntl
+except ImportError:
+    # Windows dev machines; locking is only needed for multi-worker deployments
+    fcntl = None
 
 app = Flask(__name__)
 app.secret_key = 'change_this_to_something_secret'  # Required for sessions
@@ -11,29 +28,247 @@ app.secret_key = 'change_this_to_something_secret'  # Required for sessions
 # ----------------------------------------------------------------------------
 # DATA MANAGEMENT
 # ----------------------------------------------------------------------------
-PICKS_FILE = 'picks.json'
+PICKS_DIR = 'picks'
+LEGACY_PICKS_FILE = 'picks.json'
+SCOREBOARD_CACHE_FILE = 'scoreboard_cache.json'
+SCOREBOARD_STATE_FILE = 'scoreboard_state.json'
+SCOREBOARD_REFRESH_SECONDS = 60
+# Well past the refresh interval, so requests only recompute when no worker is running
+SCOREBOARD_STALE_SECONDS = 3 * SCOREBOARD_REFRESH_SECONDS
+SCOREBOARD_LOCK_FILE = 'scoreboard.lock'
+MIGRATION_LOCK_FILE = 'picks.lock'
+_scoreboard_worker_pid = None
+_scoreboard_lock = threading.Lock()
 USERS_FILE = 'users.json'
 
+# In-process caches for ESPN responses. Weeks whose games are all completed
+# never change again, so they are promoted to the long-lived cache.
+_sched_cache = TTLCache(maxsize=128, ttl=60)
+_final_sched_cache = TTLCache(maxsize=64, ttl=6 * 60 * 60)
+# The current week changes at most once a day
+_week_cache = TTLCache(maxsize=1, ttl=10 * 60)
+# After a failed lookup the last known week is served briefly, then ESPN is retried
+_week_fallback_cache = TTLCache(maxsize=1, ttl=30)
+_last_known_week = None
+# Kickoffs are set weeks in advance, so they can live much longer than scores
+_kickoffs_cache = TTLCache(maxsize=32, ttl=60 * 60)
+_cache_lock = threading.Lock()
+
+# Successful password checks, so repeat logins skip the slow KDF. Process
+# memory only - never persist this.
+_auth_cache = TTLCache(maxsize=1024, ttl=300)
+
+# bcrypt work factor; 12 rounds is roughly 250 ms per hash on the current host
+BCRYPT_ROUNDS = 12
+
+# Shared keep-alive session so ESPN calls (including the scoreboard's parallel
+# week fetches) reuse TCP/TLS connections; transient failures are retried
+_espn_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # read=0: a stalled read is never retried, so the read timeout bounds the whole call
+    max_retries=Retry(total=2, read=0, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504)),
+)
+_espn_session = requests.Session()
+_espn_session.mount('https://', _espn_adapter)
+_espn_session.mount('http://', _espn_adapter)
+ESPN_FETCH_WORKERS = 8
+# (connect, read) seconds. Schedules keep 20 seconds for slower proxy connections;
+# the current-week lookup sits in front of every page, so it gives up quickly
+ESPN_TIMEOUT = (2, 20)
+CURRENT_WEEK_TIMEOUT = (2, 3)
+ESPN_DATE_FORMAT = "%Y-%m-%dT%H:%MZ"
+ESPN_DATE_LENGTH = len("2024-09-08T17:00Z")
+
 def load_json(filename):
     if not os.path.exists(filename):
         return {}
-    with open(filename, 'r') as f:
+    with open(filename, 'rb') as f:
         try:
-            return json.load(f)
-        except json.JSONDecodeError:
+            return orjson.loads(f.read())
+        except orjson.JSONDecodeError:
             return {}
 
-def save_json(filename, data):
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=4)
+def save_json(filename, data, pretty=True):
+    # Serialize before touching the file, then swap it in atomically so a
+    # crash mid-write can never leave a truncated picks/users file behind
+    data_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    # Unique per writer, since several workers/threads may save the same file
+    tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_filename, 'wb') as f:
+        f.write(data_bytes)
+    os.replace(tmp_filename, filename)
+
+@contextmanager
+def exclusive_lock(lock_filename, blocking=True):
+    """Cross-process lock held on a lock file; yields whether it was acquired."""
+    with open(lock_filename, 'a') as f:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def week_picks_file(week):
+    return os.path.join(PICKS_DIR, f'week_{week}.json')
+
+def load_week_picks(week):
+    """Picks for one week in the compact on-disk layout.
+
+    {'games': [game_id, ...], 'users': {user: [team_id or None, ...]}} where each
+    user's list lines up with 'games'. Lists may be shorter than 'games' if new
+    games were picked after the user last saved.
+    """
+    data = load_json(week_picks_file(week))
+    if not is_compact_week_picks(data):
+        data = compact_week_picks(data)
+    return data
+
+def save_week_picks(week, data):
+    os.makedirs(PICKS_DIR, exist_ok=True)
+    # No indentation: it would put every single pick on its own line
+    save_json(week_picks_file(week), data, pretty=False)
+
+def is_compact_week_picks(data):
+    return isinstance(data.get('games'), list) and isinstance(data.get('users'), dict)
+
+def compact_week_picks(old_picks):
+    """Converts the old {user: {game_id: team_id}} layout to the compact one."""
+    week_picks = {'games': [], 'users': {}}
+    for user, picks in old_picks.items():
+        get_user_picks(week_picks, user)
+        for game_id, team_id in picks.items():
+            set_user_pick(week_picks, user, game_id, team_id)
+    return week_picks
+
+def get_user_picks(week_picks, user):
+    """A user's picks as {game_id: team_id}; registers the user for the week if new."""
+    picks = week_picks['users'].setdefault(user, [])
+    return {game_id: team_id for game_id, team_id in zip(week_picks['games'], picks) if team_id is not None}
+
+def set_user_pick(week_picks, user, game_id, team_id):
+    games = week_picks['games']
+    if game_id in games:
+        index = games.index(game_id)
+    else:
+        index = len(games)
+        games.append(game_id)
+    picks = week_picks['users'].setdefault(user, [])
+    if len(picks) <= index:
+        picks.extend([None] * (index + 1 - len(picks)))
+    picks[index] = team_id
+
+def list_pick_weeks():
+    """Week numbers that have a picks file, in order."""
+    weeks = []
+    for path in glob.glob(os.path.join(PICKS_DIR, 'week_*.json')):
+        try:
+            weeks.append(int(os.path.basename(path)[len('week_'):-len('.json')]))
+        except ValueError:
+            continue
+    return sorted(weeks)
+
+def migrate_legacy_picks():
+    """One-time conversion of older pick storage to compact per-week files."""
+    if os.path.exists(LEGACY_PICKS_FILE):
+        # Split the old monolithic picks.json, merging into any week files that
+        # already exist; picks saved there are newer than picks.json, so they win
+        for week_str, legacy_picks in load_json(LEGACY_PICKS_FILE).items():
+            week_picks = load_week_picks(int(week_str))
+            for user, picks in legacy_picks.items():
+                current = get_user_picks(week_picks, user)
+                for game_id, team_id in picks.items():
+                    if game_id not in current:
+                        set_user_pick(week_picks, user, game_id, team_id)
+            save_week_picks(int(week_str), week_picks)
+        try:
+            os.replace(LEGACY_PICKS_FILE, LEGACY_PICKS_FILE + '.migrated')
+        except FileNotFoundError:
+            # Another worker finished the migration first
+            pass
+
+    # Rewrite week files still in the {user: {game_id: team_id}} layout
+    for week in list_pick_weeks():
+        data = load_json(week_picks_file(week))
+        if data and not is_compact_week_picks(data):
+            save_week_picks(week, compact_week_picks(data))
+
+def get_season_year():
+    """NFL seasons run into the next calendar year, so Jan/Feb belong to last year's season."""
+    year = datetime.now().year
+    if datetime.now().month < 3:
+        year -= 1
+    return year
+
+def is_week_final(schedule):
+    """True if the schedule has games and every one of them is completed."""
+    events = schedule.get('events', [])
+    if not events or schedule.get('error'):
+        return False
+    try:
+        return all(event['competitions'][0]['status']['type']['completed'] for event in events)
+    except (KeyError, IndexError):
+        return False
 
 def get_espn_schedule(week, year=None):
-    """Fetches schedule and results from ESPN API."""
+    """Returns the ESPN schedule for a week, served from the in-process cache when possible."""
     if year is None:
-        year = datetime.now().year
-        if datetime.now().month < 3:
-            year -= 1
-            
+        year = get_season_year()
+    key = (week, year)
+
+    with _cache_lock:
+        cached = _final_sched_cache.get(key) or _sched_cache.get(key)
+    if cached is not None:
+        return cached
+
+    data = fetch_espn_schedule(week, year)
+    # Don't cache failures, otherwise one ESPN hiccup sticks around for the whole TTL
+    if not data.get('error'):
+        with _cache_lock:
+            if is_week_final(data):
+                _final_sched_cache[key] = data
+            else:
+                _sched_cache[key] = data
+    return data
+
+def get_week_kickoffs(week, year=None):
+    """Kickoff times for a week as {game_id: ISO string}, cached for an hour.
+
+    Returns None if ESPN couldn't be reached, so callers can't mistake it for a week without games.
+    """
+    if year is None:
+        year = get_season_year()
+    key = (week, year)
+
+    with _cache_lock:
+        kickoffs = _kickoffs_cache.get(key)
+    if kickoffs is not None:
+        return kickoffs
+
+    schedule = get_espn_schedule(week, year)
+    # ESPN kickoffs are fixed-width UTC ISO strings ("2024-09-08T17:00Z"), which
+    # sort lexicographically, so they can be compared to now without parsing
+    kickoffs = {}
+    for event in schedule.get('events', []):
+        date = event.get('date')
+        if isinstance(date, str) and len(date) == ESPN_DATE_LENGTH and date.endswith('Z'):
+            kickoffs[str(event['id'])] = date
+
+    if schedule.get('error'):
+        return None
+    with _cache_lock:
+        _kickoffs_cache[key] = kickoffs
+    return kickoffs
+
+def fetch_espn_schedule(week, year):
+    """Fetches schedule and results from ESPN API."""
     url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
     params = {
         'week': week,
@@ -42,8 +277,7 @@ def get_espn_schedule(week, year=None):
         'limit': 100
     }
     try:
-        # Increased timeout to 20 seconds for slower proxy connections
-        r = requests.get(url, params=params, timeout=20)
+        r = _espn_session.get(url, params=params, timeout=ESPN_TIMEOUT)
         r.raise_for_status()
         data = r.json()
         
@@ -58,33 +292,249 @@ def get_espn_schedule(week, year=None):
 
 def get_current_week():
     """Helper to find the current NFL week from ESPN."""
+    global _last_known_week
+    with _cache_lock:
+        week = _week_cache.get('current') or _week_fallback_cache.get('current')
+    if week is not None:
+        return week
+
     try:
         url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-        r = requests.get(url, timeout=10)
+        r = _espn_session.get(url, timeout=CURRENT_WEEK_TIMEOUT)
+        r.raise_for_status()
         data = r.json()
-        return data.get('week', {}).get('number', 1)
-    except:
-        return 1
+        week = data.get('week', {}).get('number', 1)
+    except Exception as e:
+        print(f"CRITICAL: Error fetching current NFL week: {e}")
+        if _last_known_week is None:
+            # Nothing real seen yet, so don't pin anyone to the default week
+            return 1
+        # Serve the last week we saw; caching it briefly keeps an ESPN outage
+        # from costing every page view a full timeout
+        with _cache_lock:
+            _week_fallback_cache['current'] = _last_known_week
+        return _last_known_week
+
+    with _cache_lock:
+        _week_cache['current'] = week
+        _last_known_week = week
+    return week
 
-def determine_winners(games):
-    """Parses ESPN data to find winners of completed games."""
+def hash_password(password):
+    """bcrypt hash stored as str, since users.json can't hold bytes."""
+    # bcrypt only looks at the first 72 bytes and newer versions raise on longer input
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+def is_bcrypt_hash(stored_hash):
+    return stored_hash.startswith('$2')
+
+def check_password(stored_hash, password):
+    """Checks a password against a bcrypt hash, or a legacy Werkzeug hash from before the switch."""
+    if is_bcrypt_hash(stored_hash):
+        return bcrypt.checkpw(password.encode()[:72], stored_hash.encode())
+    return check_password_hash(stored_hash, password)
+
+def verify_password(username, stored_hash, password):
+    """check_password with a short-lived cache of successful verifications."""
+    # The stored hash is part of the key so a changed password invalidates old entries
+    key = hashlib.sha256(f"{username}|{stored_hash}|{password}".encode()).hexdigest()
+    with _cache_lock:
+        if key in _auth_cache:
+            return True
+
+    if not check_password(stored_hash, password):
+        return False
+    with _cache_lock:
+        _auth_cache[key] = True
+    return True
+
+def score_week(schedule, week_picks):
+    """Scores one week of picks against its ESPN schedule.
+
+    Returns {'players': {player: {'correct': n, 'teams': {team_id: [picked, wins]}}},
+    'teams': {team_id: [name, logo]}} - plain JSON so closed weeks can be cached on disk.
+    """
+    # Single pass over the schedule for both team info and winners
+    teams = {}
     winners = {}
-    if not games or 'events' not in games: 
-        return winners
-        
-    for event in games.get('events', []):
+    for event in schedule.get('events', []):
         if not event.get('competitions'): continue
         competition = event['competitions'][0]
-        if competition['status']['type']['completed']:
-            for competitor in competition['competitors']:
-                if competitor.get('winner', False):
-                    winners[str(event['id'])] = competitor['team']['id']
-    return winners
+        completed = competition['status']['type']['completed']
+        for competitor in competition['competitors']:
+            team = competitor['team']
+            if team['id'] not in teams:
+                teams[team['id']] = [team['displayName'], team.get('logo', 'https://a.espncdn.com/i/teamlogos/nfl/500/nfl.png')]
+            if completed and competitor.get('winner', False):
+                winners[str(event['id'])] = team['id']
+
+    # Winning team per game, aligned with the compact pick lists
+    game_winners = [winners.get(game_id) for game_id in week_picks['games']]
+
+    players = {}
+    for player, picks in week_picks['users'].items():
+        correct = 0
+        team_counts = {}
+        for picked_team_id, winner_id in zip(picks, game_winners):
+            if picked_team_id is None: continue
+            counts = team_counts.setdefault(picked_team_id, [0, 0])
+            counts[0] += 1
+            if picked_team_id == winner_id:
+                correct += 1
+                counts[1] += 1
+        players[player] = {'correct': correct, 'teams': team_counts}
+    return {'players': players, 'teams': teams}
+
+def compute_scoreboard_state():
+    """Everything on the scoreboard that doesn't depend on who is looking at it."""
+    current_week = get_current_week()
+    last_week = current_week - 1 if current_week > 1 else 1
+    live_weeks = {current_week, last_week}
+
+    # Closed weeks come straight from the results cache; everything else is
+    # re-scored against a fresh ESPN schedule
+    pick_weeks = list_pick_weeks()
+    results_cache = load_json(SCOREBOARD_CACHE_FILE)
+    week_results = {}
+    stale_weeks = []
+    for week in pick_weeks:
+        cached = results_cache.get(str(week))
+        if week not in live_weeks and cached and cached['mtime'] == os.path.getmtime(week_picks_file(week)):
+            week_results[week] = cached
+        else:
+            stale_weeks.append(week)
+
+    # Fetch all stale weeks concurrently; each call is network-bound
+    with ThreadPoolExecutor(max_workers=ESPN_FETCH_WORKERS) as executor:
+        schedules = dict(zip(stale_weeks, executor.map(get_espn_schedule, stale_weeks)))
+
+    cache_changed = False
+    for week in stale_weeks:
+        mtime = os.path.getmtime(week_picks_file(week))
+        week_results[week] = score_week(schedules[week], load_week_picks(week))
+        week_results[week]['mtime'] = mtime
+        if week not in live_weeks and is_week_final(schedules[week]):
+            results_cache[str(week)] = week_results[week]
+            cache_changed = True
+    if cache_changed:
+        save_json(SCOREBOARD_CACHE_FILE, results_cache)
+
+    season_totals = {}
+    weekly_results = {str(current_week): {}, str(last_week): {}}
+    # Team names/logos are stable over a season, so one lookup serves every week
+    team_lookup = {}
+    # {player: {team_id: [picked, wins]}} over the season, for the per-player stats
+    player_teams = {}
+
+    for week in pick_weeks:
+        week_str = str(week)
+        results = week_results[week]
+        team_lookup.update(results['teams'])
+
+        for player, player_results in results['players'].items():
+            if player not in season_totals:
+                season_totals[player] = {'correct': 0, 'weeks_played': 0}
+            
+            teams = player_teams.setdefault(player, {})
+            for picked_team_id, (picked, wins) in player_results['teams'].items():
+                counts = teams.setdefault(picked_team_id, [0, 0])
+                counts[0] += picked
+                counts[1] += wins
+            
+            if week_str in weekly_results:
+                weekly_results[week_str][player] = player_results['correct']
+            
+            season_totals[player]['correct'] += player_results['correct']
+            season_totals[player]['weeks_played'] += 1
+
+    return {
+        'current_week': current_week,
+        'last_week': last_week,
+        'season_totals': dict(sorted(season_totals.items(), key=lambda item: item[1]['correct'], reverse=True)),
+        'weekly_results': weekly_results,
+        'all_players': sorted(player_teams),
+        'teams': team_lookup,
+        'player_teams': player_teams,
+    }
+
+def refresh_scoreboard_state():
+    state = compute_scoreboard_state()
+    save_json(SCOREBOARD_STATE_FILE, state)
+    return state
+
+def scoreboard_state_age():
+    """Seconds since the state file was written, or None if there is none yet."""
+    try:
+        return time.time() - os.path.getmtime(SCOREBOARD_STATE_FILE)
+    except OSError:
+        return None
+
+def try_refresh_scoreboard_state():
+    """Refreshes the state unless another thread or worker already is; returns None if skipped."""
+    if not _scoreboard_lock.acquire(blocking=False):
+        return None
+    try:
+        with exclusive_lock(SCOREBOARD_LOCK_FILE, blocking=False) as acquired:
+            return refresh_scoreboard_state() if acquired else None
+    finally:
+        _scoreboard_lock.release()
+
+def _recompute_scoreboard_loop():
+    while True:
+        time.sleep(SCOREBOARD_REFRESH_SECONDS)
+        # Another worker process may already have refreshed it
+        age = scoreboard_state_age()
+        if age is not None and age < SCOREBOARD_REFRESH_SECONDS:
+            continue
+        try:
+            try_refresh_scoreboard_state()
+        except Exception as e:
+            print(f"CRITICAL: Error recomputing scoreboard: {e}")
+
+def start_scoreboard_worker():
+    """Starts the background refresh once per process, on first use."""
+    global _scoreboard_worker_pid
+    # Keyed on the pid so a worker forked from a preloaded master gets its own thread
+    with _cache_lock:
+        if _scoreboard_worker_pid == os.getpid():
+            return
+        _scoreboard_worker_pid = os.getpid()
+    threading.Thread(target=_recompute_scoreboard_loop, daemon=True).start()
+
+_picks_migrated = False
+_migration_lock = threading.Lock()
+
+def ensure_picks_migrated():
+    """Runs migrate_legacy_picks() once per process, serialized across workers."""
+    global _picks_migrated
+    with _migration_lock:
+        if _picks_migrated:
+            return
+        # Holding the lock file means no other worker is mid-migration, so
+        # nobody can write a week file that this migration then overwrites
+        with exclusive_lock(MIGRATION_LOCK_FILE):
+            migrate_legacy_picks()
+        _picks_migrated = True
 
 # ----------------------------------------------------------------------------
 # ROUTES
 # ----------------------------------------------------------------------------
 
+@app.cli.command('migrate-picks')
+def migrate_picks_command():
+    """Convert picks.json and old-layout week files to compact per-week files."""
+    ensure_picks_migrated()
+    click.echo("Picks storage is up to date.")
+
+@app.before_request
+def migrate_picks_before_first_request():
+    if not _picks_migrated:
+        ensure_picks_migrated()
+
+def fast_json(obj, status=200):
+    """Drop-in for jsonify that serializes with orjson."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 @app.route('/')
 def index():
     if 'user' not in session:
@@ -97,11 +547,11 @@ def check_user():
     data = request.get_json()
     username = data.get('username', '').strip()
     if not username:
-        return jsonify({'error': 'Username required'}), 400
+        return fast_json({'error': 'Username required'}, status=400)
     
     users = load_json(USERS_FILE)
     exists = username in users
-    return jsonify({'exists': exists})
+    return fast_json({'exists': exists})
 
 @app.route('/login', methods=['POST'])
 def login():
@@ -115,13 +565,17 @@ def login():
     users = load_json(USERS_FILE)
     
     if username not in users:
-        users[username] = generate_password_hash(password)
+        users[username] = hash_password(password)
         save_json(USERS_FILE, users)
         session['user'] = username
         flash(f"Welcome to the league, {username}!")
     else:
-        if check_password_hash(users[username], password):
+        if verify_password(username, users[username], password):
             session['user'] = username
+            # Upgrade legacy Werkzeug hashes now that we have the plain password
+            if not is_bcrypt_hash(users[username]):
+                users[username] = hash_password(password)
+                save_json(USERS_FILE, users)
         else:
             flash("Incorrect password.")
             return redirect('/')
@@ -139,46 +593,41 @@ def week_view(week):
         return redirect('/')
     
     user = session['user']
-    all_data = load_json(PICKS_FILE)
-    
-    week_str = str(week)
-    if week_str not in all_data:
-        all_data[week_str] = {}
-    if user not in all_data[week_str]:
-        all_data[week_str][user] = {}
-
-    schedule = get_espn_schedule(week)
-    
-    # If the API failed, notify the user instead of showing a blank page
-    if schedule.get('error'):
-        flash("Could not sync with NFL scores. Please refresh or try again in a moment.")
+    week_picks = load_week_picks(week)
 
     now = datetime.now(timezone.utc)
 
     if request.method == 'POST':
-        game_start_times = {}
-        for event in schedule.get('events', []):
-            try:
-                start_time = datetime.strptime(event['date'], "%Y-%m-%dT%H:%MZ").replace(tzinfo=timezone.utc)
-                game_start_times[str(event['id'])] = start_time
-            except:
-                continue
+        # Only kickoff times are needed to lock picks, so skip the full schedule
+        now_iso = now.strftime(ESPN_DATE_FORMAT)
+        game_start_times = get_week_kickoffs(week)
+        if game_start_times is None:
+            # Without kickoff times we can't tell which games are already locked
+            flash("Could not sync with NFL scores, so your picks were not saved. Please try again in a moment.")
+            return redirect(url_for('week_view', week=week))
 
         saved_count = 0
         blocked_count = 0
+        get_user_picks(week_picks, user)  # registers the user for the week even if every pick is locked
         for game_id, team_id in request.form.items():
             kickoff = game_start_times.get(game_id)
-            if not kickoff or now < kickoff:
-                all_data[week_str][user][game_id] = team_id
+            if not kickoff or now_iso < kickoff:
+                set_user_pick(week_picks, user, game_id, team_id)
                 saved_count += 1
             else:
                 blocked_count += 1
         
-        save_json(PICKS_FILE, all_data)
+        save_week_picks(week, week_picks)
         flash(f"Saved {saved_count} picks.")
         return redirect(url_for('week_view', week=week))
 
-    user_picks = all_data[week_str].get(user, {})
+    schedule = get_espn_schedule(week)
+    
+    # If the API failed, notify the user instead of showing a blank page
+    if schedule.get('error'):
+        flash("Could not sync with NFL scores. Please refresh or try again in a moment.")
+
+    user_picks = get_user_picks(week_picks, user)
     return render_template('week.html', 
                            week=week, 
                            schedule=schedule, 
@@ -190,73 +639,42 @@ def scoreboard():
     if 'user' not in session:
         return redirect('/')
     
-    all_data = load_json(PICKS_FILE)
-    current_week = get_current_week()
-    last_week = current_week - 1 if current_week > 1 else 1
-    
-    all_players = set()
-    for week_data in all_data.values():
-        all_players.update(week_data.keys())
-    all_players = sorted(list(all_players))
+    # The background worker keeps this fresh, so normally this is just a file read
+    start_scoreboard_worker()
+    state = load_json(SCOREBOARD_STATE_FILE)
+    if not state:
+        # First run: whoever gets the lock computes it, everyone else waits for theirs
+        with _scoreboard_lock, exclusive_lock(SCOREBOARD_LOCK_FILE):
+            state = load_json(SCOREBOARD_STATE_FILE) or refresh_scoreboard_state()
+    elif scoreboard_state_age() >= SCOREBOARD_STALE_SECONDS:
+        # No worker is refreshing it (e.g. a server without threads); one request
+        # recomputes while the others keep serving the existing state
+        state = try_refresh_scoreboard_state() or state
+
     selected_player = request.args.get('player', session['user'])
 
-    season_totals = {}
-    weekly_results = {str(current_week): {}, str(last_week): {}}
-    
+    # Only the selected player's team breakdown is built per request
     team_stats = {}
     total_picks = 0
     total_wins = 0
+    fav_team_id, fav_count = None, 0
+    for picked_team_id, (picked, wins) in state['player_teams'].get(selected_player, {}).items():
+        name, logo = state['teams'].get(picked_team_id, ('Unknown', ''))
+        team_stats[picked_team_id] = {'name': name, 'logo': logo, 'times_picked': picked, 'wins': wins}
+        total_picks += picked
+        total_wins += wins
+        if picked > fav_count:
+            fav_team_id, fav_count = picked_team_id, picked
 
-    for week_str, week_picks in all_data.items():
-        schedule = get_espn_schedule(int(week_str)) 
-        winners = determine_winners(schedule)
-        
-        team_lookup = {}
-        for event in schedule.get('events', []):
-            if not event.get('competitions'): continue
-            for competitor in event['competitions'][0]['competitors']:
-                tid = competitor['team']['id']
-                team_lookup[tid] = {
-                    'name': competitor['team']['displayName'],
-                    'logo': competitor['team'].get('logo', 'https://a.espncdn.com/i/teamlogos/nfl/500/nfl.png')
-                }
-
-        for player, picks in week_picks.items():
-            if player not in season_totals:
-                season_totals[player] = {'correct': 0, 'weeks_played': 0}
-            
-            week_score = 0
-            for game_id, picked_team_id in picks.items():
-                is_win = game_id in winners and winners[game_id] == picked_team_id
-                if is_win:
-                    week_score += 1
-                
-                if player == selected_player:
-                    total_picks += 1
-                    if is_win: total_wins += 1
-                    if picked_team_id not in team_stats:
-                        info = team_lookup.get(picked_team_id, {'name': 'Unknown', 'logo': ''})
-                        team_stats[picked_team_id] = {'name': info['name'], 'logo': info['logo'], 'times_picked': 0, 'wins': 0}
-                    team_stats[picked_team_id]['times_picked'] += 1
-                    if is_win: team_stats[picked_team_id]['wins'] += 1
-            
-            if week_str in [str(current_week), str(last_week)]:
-                weekly_results[week_str][player] = week_score
-            
-            season_totals[player]['correct'] += week_score
-            season_totals[player]['weeks_played'] += 1
-
-    sorted_totals = dict(sorted(season_totals.items(), key=lambda item: item[1]['correct'], reverse=True))
     win_rate = round((total_wins / total_picks * 100), 1) if total_picks > 0 else 0
-    fav_team_id = max(team_stats, key=lambda x: team_stats[x]['times_picked'], default=None)
     fav_team_name = team_stats[fav_team_id]['name'] if fav_team_id else "N/A"
 
     return render_template('scoreboard.html', 
-                           season_totals=sorted_totals, 
-                           weekly_results=weekly_results,
-                           current_week=current_week,
-                           last_week=last_week,
-                           all_players=all_players,
+                           season_totals=state['season_totals'], 
+                           weekly_results=state['weekly_results'],
+                           current_week=state['current_week'],
+                           last_week=state['last_week'],
+                           all_players=state['all_players'],
                            selected_player=selected_player,
                            team_stats=team_stats,
                            total_picks=total_picks,